@@ -23,6 +23,32 @@ def _row_signatures(rows: Any) -> List[str]:
     return signatures
 
 
+# Signatures for the current baseline's result rows. Every optimization
+# attempt is compared against the same baseline, so sorting and re-serializing
+# the baseline rows on each comparison was wasted work. Only one baseline is
+# live at a time, so the cache holds a single entry keyed by the identity of
+# the baseline results list; establishing a new baseline replaces the entry
+# and releases the old result set. The inner signature map is keyed by row
+# list identity, which stays valid because the results list keeps its row
+# lists alive for as long as they are cached.
+_baseline_signature_cache = None  # (baseline_results, {id(rows): signatures})
+
+
+def _cached_row_signatures(baseline_results: List[Any], rows: Any) -> List[str]:
+    global _baseline_signature_cache
+
+    cached = _baseline_signature_cache
+    if cached is None or cached[0] is not baseline_results:
+        cached = (baseline_results, {})
+        _baseline_signature_cache = cached
+
+    signatures = cached[1].get(id(rows))
+    if signatures is None:
+        signatures = _row_signatures(rows)
+        cached[1][id(rows)] = signatures
+    return signatures
+
+
 def calculate_improvement(
     baseline_metrics: Dict[str, Any],
     optimized_metrics: Dict[str, Any]
@@ -121,7 +147,7 @@ def compute_semantic_equivalence(
             current_rows_data = current_result.get("Rows", [])
             baseline_rows_data = baseline_result.get("Rows", [])
             
-            if _row_signatures(current_rows_data) != _row_signatures(baseline_rows_data):
+            if _row_signatures(current_rows_data) != _cached_row_signatures(baseline_results, baseline_rows_data):
                 all_reasons.append(f"Result #{result_num}: Data values differ")
 
     return {
@@ -1,6 +1,7 @@
 """DAX query execution and preparation tools with SessionState integration."""
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Set, Optional
 from collections import deque
 from ..infrastructure.auth import get_access_token
@@ -75,18 +76,33 @@ def execute_multiple_dax_runs(
     return successful_runs, True, None
 
 
+# Cache of TMSCHEMA_FUNCTIONS DMV results keyed by (endpoint, dataset). The
+# user-defined-function catalog does not change while tuning a query, so
+# repeated prepare calls reuse the first fetch instead of re-querying the
+# endpoint every time. Failed fetches are not cached.
+_function_catalog_cache: Dict[Tuple[str, str], List[Dict]] = {}
+
+
+# Compiled once at import time - these helpers run for every candidate token
+# during dependency collection, so per-call re.compile overhead adds up.
+_NORMALIZE_PATTERN = re.compile(r"[^0-9A-Za-z]")
+_BRACKET_PATTERN = re.compile(r"\[([^\]]+)\]")
+_FUNCTION_CALL_PATTERN = re.compile(r'([\w\.]+)\s*\(')
+
+
+@lru_cache(maxsize=4096)
 def _normalize_name(name: str) -> str:
-    return re.sub(r"[^0-9A-Za-z]", "", name).lower()
+    # The same measure/function names are normalized many times while building
+    # catalogs and walking dependencies, so memoize the result per name.
+    return _NORMALIZE_PATTERN.sub("", name).lower()
 
 
 def _extract_bracket_tokens(text: str) -> Set[str]:
-    bracket_pattern = re.compile(r"\[([^\]]+)\]")
-    return set(bracket_pattern.findall(text))
+    return set(_BRACKET_PATTERN.findall(text))
 
 
 def _extract_function_calls(text: str) -> Set[str]:
-    function_pattern = re.compile(r'([\w\.]+)\s*\(')
-    matches = function_pattern.findall(text)
+    matches = _FUNCTION_CALL_PATTERN.findall(text)
     return {m for m in matches if '.' in m or not m.isupper()}
 
 
@@ -400,15 +416,20 @@ def prepare_query_for_optimization_core(query: str) -> Dict[str, Any]:
             else:
                 measures_info, measure_lookup = _build_measure_catalog(measures_data)
             
-            functions_query = "SELECT * FROM $SYSTEM.TMSCHEMA_FUNCTIONS"
-            functions_result = execute_dmv_query(xmla_endpoint, dataset_name, functions_query)
-            
-            if isinstance(functions_result, dict) and functions_result.get("status") == "error":
-                # Functions query failed - continue without functions (some models may not have UDFs)
-                functions_data = []
+            cache_key = (xmla_endpoint, dataset_name)
+            if cache_key in _function_catalog_cache:
+                functions_data = _function_catalog_cache[cache_key]
             else:
-                functions_data = functions_result
-            
+                functions_query = "SELECT * FROM $SYSTEM.TMSCHEMA_FUNCTIONS"
+                functions_result = execute_dmv_query(xmla_endpoint, dataset_name, functions_query)
+
+                if isinstance(functions_result, dict) and functions_result.get("status") == "error":
+                    # Functions query failed - continue without functions (some models may not have UDFs)
+                    functions_data = []
+                else:
+                    functions_data = functions_result
+                    _function_catalog_cache[cache_key] = functions_data
+
             # Build function catalog
             functions_info, function_lookup = _build_function_catalog(functions_data)
 
@@ -1,5 +1,6 @@
 """Model metadata utilities that operate on the active XMLA session."""
 
+import concurrent.futures
 import json
 from typing import Dict, Any, List, Optional, Tuple
 from ..infrastructure.xmla import execute_dax_query_direct
@@ -109,21 +110,33 @@ def _execute_metadata_queries(xmla_endpoint: str, dataset_name: str) -> Dict[str
         )
         """
 
-        parsed_tables = _run_metadata_query(xmla_endpoint, dataset_name, tables_query, "tables")
-        if not parsed_tables:
-            return {"status": "error", "error": "Failed to retrieve table metadata"}
-        parsed_columns = _run_metadata_query(xmla_endpoint, dataset_name, columns_query, "columns")
-        if not parsed_columns:
-            return {"status": "error", "error": "Failed to retrieve column metadata"}
-        parsed_measures = _run_metadata_query(xmla_endpoint, dataset_name, measures_query, "measures")
-        if not parsed_measures:
-            return {"status": "error", "error": "Failed to retrieve measure metadata"}
-        parsed_relationships = _run_metadata_query(xmla_endpoint, dataset_name, relationships_query, "relationships")
-        if not parsed_relationships:
-            return {"status": "error", "error": "Failed to retrieve relationship metadata"}
-        parsed_column_names = _run_metadata_query(xmla_endpoint, dataset_name, column_names_query, "column names")
-        if not parsed_column_names:
-            return {"status": "error", "error": "Failed to retrieve column name metadata"}
+        # The metadata queries are independent of each other, so issue them
+        # concurrently instead of paying five sequential endpoint round-trips.
+        # Each execution opens its own ADOMD connection, so this is safe.
+        query_specs = [
+            ("tables", tables_query, "table"),
+            ("columns", columns_query, "column"),
+            ("measures", measures_query, "measure"),
+            ("relationships", relationships_query, "relationship"),
+            ("column names", column_names_query, "column name"),
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(query_specs)) as executor:
+            futures = {
+                label: executor.submit(_run_metadata_query, xmla_endpoint, dataset_name, query, label)
+                for label, query, _ in query_specs
+            }
+            parsed = {label: future.result() for label, future in futures.items()}
+
+        for label, _, error_noun in query_specs:
+            if not parsed[label]:
+                return {"status": "error", "error": f"Failed to retrieve {error_noun} metadata"}
+
+        parsed_tables = parsed["tables"]
+        parsed_columns = parsed["columns"]
+        parsed_measures = parsed["measures"]
+        parsed_relationships = parsed["relationships"]
+        parsed_column_names = parsed["column names"]
 
         table_rows = parsed_tables.get("rows", [])
         column_rows = parsed_columns.get("rows", [])
@@ -26,6 +26,29 @@ from ..config import (
 from ..data.article_patterns import ARTICLE_PATTERNS
 
 
+def _compile_article_patterns() -> Dict[str, List[re.Pattern]]:
+    """Compile every article's patterns once at import time.
+
+    analyze_query_patterns runs the full pattern catalog against each query,
+    so compiling per call multiplied the regex-compilation cost by the number
+    of optimization sessions. Invalid patterns are dropped here instead of
+    being skipped on every call.
+    """
+    compiled_patterns = {}
+    for article_id, config in ARTICLE_PATTERNS.items():
+        compiled = []
+        for pattern in config.get("patterns", []):
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE | re.DOTALL))
+            except re.error:
+                continue
+        compiled_patterns[article_id] = compiled
+    return compiled_patterns
+
+
+_COMPILED_ARTICLE_PATTERNS = _compile_article_patterns()
+
+
 def analyze_query_patterns(query: str) -> tuple[List[str], Dict[str, List[Dict[str, str]]]]:
     if not query or not query.strip():
         return [], {}
@@ -34,25 +57,20 @@ def analyze_query_patterns(query: str) -> tuple[List[str], Dict[str, List[Dict[s
     pattern_matches = {}
 
     for article_id, config in ARTICLE_PATTERNS.items():
-        patterns = config.get("patterns", [])
-
-        if not patterns:
+        if not config.get("patterns", []):
             relevant_articles.append(article_id)
             continue
 
         article_matches = []
-        for pattern in patterns:
-            try:
-                for match in re.finditer(pattern, query, re.IGNORECASE | re.DOTALL):
-                    start_pos = max(0, match.start() - 50)
-                    end_pos = min(len(query), match.end() + 50)
-                    article_matches.append({
-                        "matched_text": match.group(0).strip(),
-                        "context": query[start_pos:end_pos].strip()
-                    })
-            except re.error:
-                continue
-                
+        for pattern in _COMPILED_ARTICLE_PATTERNS.get(article_id, []):
+            for match in pattern.finditer(query):
+                start_pos = max(0, match.start() - 50)
+                end_pos = min(len(query), match.end() + 50)
+                article_matches.append({
+                    "matched_text": match.group(0).strip(),
+                    "context": query[start_pos:end_pos].strip()
+                })
+
         if article_matches:
             relevant_articles.append(article_id)
             pattern_matches[article_id] = article_matches
@@ -60,7 +78,19 @@ def analyze_query_patterns(query: str) -> tuple[List[str], Dict[str, List[Dict[s
     return relevant_articles, pattern_matches
 
 
+# Successful fetches keyed by URL. The articles are static reference material,
+# so repeated optimization sessions that match the same patterns reuse the
+# downloaded copy instead of re-fetching and re-parsing it. Failed fetches are
+# not cached so transient network errors retry on the next call.
+_article_cache: Dict[str, Dict[str, Any]] = {}
+
+
 def fetch_single_article(url: str) -> Optional[Dict[str, Any]]:
+    cached = _article_cache.get(url)
+    if cached is not None:
+        # Callers annotate the result in place, so hand out a copy
+        return dict(cached)
+
     try:
         response = requests.get(url, timeout=RESEARCH_REQUEST_TIMEOUT)
         if response.status_code != 200:
@@ -78,7 +108,9 @@ def fetch_single_article(url: str) -> Optional[Dict[str, Any]]:
         if len(content) < RESEARCH_MIN_CONTENT_LENGTH:
             return None
 
-        return {"url": url, "title": title, "content": content}
+        result = {"url": url, "title": title, "content": content}
+        _article_cache[url] = result
+        return dict(result)
 
     except Exception:
         return None
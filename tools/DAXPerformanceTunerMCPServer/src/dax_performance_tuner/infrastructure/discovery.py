@@ -71,17 +71,29 @@ def _discover_desktop_instances() -> Dict[str, Any]:
                         except Exception:
                             pass
                         
-                        datasets = _list_databases_on_endpoint(f"localhost:{port}")
-                        
                         instances.append({
                             'port': port,
                             'window_title': window_title,
                             'parent_process_name': parent_name,
-                            'datasets': datasets
+                            'datasets': []
                         })
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
-        
+
+        # List datasets on all discovered instances concurrently - each
+        # listing opens its own connection, and with several Desktop models
+        # open the serial version paid one XMLA round-trip per instance.
+        if instances:
+            import concurrent.futures
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(instances)) as executor:
+                dataset_lists = list(executor.map(
+                    lambda instance: _list_databases_on_endpoint(f"localhost:{instance['port']}"),
+                    instances
+                ))
+            for instance, datasets in zip(instances, dataset_lists):
+                instance['datasets'] = datasets
+
         instances.sort(key=lambda x: x['port'])
         
         if not instances:
@@ -60,7 +60,12 @@ class BPAAnalyzer:
         """
         self.rules: List[BPARule] = []
         self.violations: List[BPAViolation] = []
-        
+        self._calculated_by_table: Dict[str, bool] = {}
+        # Compiled RegEx.IsMatch patterns keyed by rule expression, so each
+        # rule's embedded pattern is extracted and compiled once rather than
+        # per object it is evaluated against
+        self._rule_pattern_cache: Dict[str, tuple] = {}
+
         if rules_file_path:
             self.load_rules(rules_file_path)
     
@@ -117,7 +122,17 @@ class BPAAnalyzer:
         if not model:
             logger.warning("No model found in TMSL structure")
             return self.violations
-        
+
+        # Classify each table as calculated or regular once per analysis.
+        # The table and column scope checks previously re-derived this from
+        # the partition source for every rule x table combination.
+        self._calculated_by_table = {}
+        for table in model.get('tables', []):
+            partitions = table.get('partitions') or [{}]
+            self._calculated_by_table[table.get('name', '')] = (
+                partitions[0].get('source', {}).get('type') == 'calculated'
+            )
+
         # Analyze each rule
         for rule in self.rules:
             try:
@@ -186,9 +201,10 @@ class BPAAnalyzer:
         
         for table in tables:
             # Filter by table type if specified
-            if table_type == "CalculatedTable" and not table.get('partitions', [{}])[0].get('source', {}).get('type') == 'calculated':
+            is_calculated = self._calculated_by_table.get(table.get('name', ''), False)
+            if table_type == "CalculatedTable" and not is_calculated:
                 continue
-            elif table_type == "Table" and table.get('partitions', [{}])[0].get('source', {}).get('type') == 'calculated':
+            elif table_type == "Table" and is_calculated:
                 continue
                 
             try:
@@ -223,7 +239,7 @@ class BPAAnalyzer:
                     continue
                 elif column_type == "CalculatedTableColumn":
                     # Check if this is a calculated table
-                    if not table.get('partitions', [{}])[0].get('source', {}).get('type') == 'calculated':
+                    if not self._calculated_by_table.get(table.get('name', ''), False):
                         continue
                         
                 try:
@@ -568,20 +584,12 @@ class BPAAnalyzer:
             # DAX expression checks using regex
             if "RegEx.IsMatch" in expression and obj_type in ["measure", "kpi", "calculation_item"]:
                 dax_expression = obj.get('expression', '')
-                
-                # Extract regex pattern from the rule expression
-                regex_match = re.search(r'RegEx\.IsMatch\([^,]+,\s*"([^"]+)"\)', expression)
-                if regex_match:
-                    pattern = regex_match.group(1)
-                    # Convert from .NET regex to Python regex
-                    pattern = pattern.replace('(?i)', '')  # Remove case insensitive flag
-                    pattern = pattern.replace('\\s*\\(', r'\s*\(')  # Fix spacing patterns
-                    
-                    try:
-                        return bool(re.search(pattern, dax_expression, re.IGNORECASE))
-                    except re.error:
-                        logger.debug(f"Invalid regex pattern: {pattern}")
-                        return False
+
+                status, compiled = self._get_rule_regex(expression)
+                if status == 'ok':
+                    return bool(compiled.search(dax_expression))
+                if status == 'invalid':
+                    return False
             
             # Name formatting checks
             if "Name.StartsWith" in expression or "Name.EndsWith" in expression:
@@ -640,6 +648,37 @@ class BPAAnalyzer:
             logger.debug(f"Error evaluating expression '{expression}': {str(e)}")
             return False
 
+    def _get_rule_regex(self, expression: str) -> tuple:
+        """
+        Extract and compile the RegEx.IsMatch pattern embedded in a rule
+        expression, caching the result per rule expression.
+
+        Returns:
+            Tuple of (status, compiled pattern or None) where status is
+            'ok', 'invalid' (pattern found but failed to compile), or
+            'none' (no pattern found in the expression)
+        """
+        cached = self._rule_pattern_cache.get(expression)
+        if cached is not None:
+            return cached
+
+        result = ('none', None)
+        regex_match = re.search(r'RegEx\.IsMatch\([^,]+,\s*"([^"]+)"\)', expression)
+        if regex_match:
+            pattern = regex_match.group(1)
+            # Convert from .NET regex to Python regex
+            pattern = pattern.replace('(?i)', '')  # Remove case insensitive flag
+            pattern = pattern.replace('\\s*\\(', r'\s*\(')  # Fix spacing patterns
+
+            try:
+                result = ('ok', re.compile(pattern, re.IGNORECASE))
+            except re.error:
+                logger.debug(f"Invalid regex pattern: {pattern}")
+                result = ('invalid', None)
+
+        self._rule_pattern_cache[expression] = result
+        return result
+
     def get_violations_summary(self) -> Dict[str, Any]:
         """Get a summary of violations by category and severity"""
         summary = {
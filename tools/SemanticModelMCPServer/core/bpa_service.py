@@ -236,14 +236,29 @@ class BPAService:
             'timestamp': json.dumps(None),  # Would use datetime in real implementation
             'format_type': format_type
         }
-        
+
+        # Clean model - return the report shell with empty groupings instead
+        # of running the per-format formatting below
+        if not violations:
+            if format_type == 'summary':
+                report['violations_by_severity'] = {'ERROR': [], 'WARNING': [], 'INFO': []}
+            elif format_type == 'detailed':
+                report['all_violations'] = []
+            elif format_type == 'by_category':
+                report['violations_by_category'] = {}
+            return report
+
         if format_type == 'summary':
-            report['violations_by_severity'] = {
-                'ERROR': [v for v in violations if v['severity'] == 'ERROR'],
-                'WARNING': [v for v in violations if v['severity'] == 'WARNING'],  
-                'INFO': [v for v in violations if v['severity'] == 'INFO']
-            }
-            
+            # Bucket by severity in a single pass instead of filtering the
+            # violation list once per severity level
+            by_severity = {'ERROR': [], 'WARNING': [], 'INFO': []}
+            for violation in violations:
+                severity = violation['severity']
+                if severity in by_severity:
+                    by_severity[severity].append(violation)
+            report['violations_by_severity'] = by_severity
+
+
         elif format_type == 'detailed':
             report['all_violations'] = violations
             
@@ -1,22 +1,19 @@
 from fastmcp import FastMCP
 import logging
-import clr
 import os
 import json
-import sys
+import threading
 from typing import List, Optional
 from core.auth import get_access_token
-from core.azure_token_manager import get_cached_azure_token, clear_token_cache
+from core.azure_token_manager import get_cached_azure_token
 from core.bpa_service import BPAService
 from tools.fabric_metadata import list_workspaces, list_datasets, get_workspace_id, list_notebooks, list_delta_tables, list_lakehouses, list_lakehouse_files, get_lakehouse_sql_connection_string as fabric_get_lakehouse_sql_connection_string
 from tools.bpa_tools import register_bpa_tools
 from tools.powerbi_desktop_tools import register_powerbi_desktop_tools
 from tools.microsoft_learn_tools import register_microsoft_learn_tools
 import urllib.parse
-from src.helper import count_nodes_with_name
+from src.helper import count_nodes_with_names
 from src.tmsl_validator import validate_tmsl_structure
-import time
-from datetime import datetime, timedelta
 from prompts import register_prompts
 from __version__ import __version__, __description__
 
@@ -26,6 +23,107 @@ try:
 except ImportError:
     pyodbc = None
 
+# .NET assembly references only need to be registered once per process.
+# Re-registering them on every tool call adds avoidable per-query overhead,
+# so each tool reuses this single load via _ensure_dotnet_assemblies().
+_dotnet_assemblies_loaded = False
+
+def _ensure_dotnet_assemblies() -> None:
+    """Register the bundled .NET assemblies with pythonnet once per process."""
+    global _dotnet_assemblies_loaded
+    if _dotnet_assemblies_loaded:
+        return
+
+    # Importing clr starts the .NET runtime, which is the most expensive part
+    # of server startup; defer it until a tool actually needs the assemblies.
+    import clr
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    dotnet_dir = os.path.join(script_dir, "dotnet")
+
+    print(f"Using .NET assemblies from: {dotnet_dir}")
+
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.Identity.Client.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.IdentityModel.Abstractions.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.AdomdClient.dll"))
+
+    _dotnet_assemblies_loaded = True
+
+# Idle ADOMD connections pooled per (workspace, dataset). Connections are
+# checked out for the duration of a query and checked back in afterwards, so
+# concurrent tool calls never share one - ADOMD connections do not support
+# concurrent commands. Each pooled entry remembers the access token it was
+# opened with; when the token refreshes, the stale connection is closed and
+# replaced instead of lingering open. Keeping connections open between calls
+# skips the TCP + auth handshake, which dominates the cost of short queries.
+_adomd_pool_lock = threading.Lock()
+_adomd_idle_connections = {}
+
+def _checkout_adomd_connection(workspace_name: str, dataset_name: str, access_token: str):
+    """Check out an open ADOMD connection, reusing an idle pooled one when possible."""
+    from Microsoft.AnalysisServices.AdomdClient import AdomdConnection  # type: ignore
+
+    key = (workspace_name, dataset_name)
+    connection = None
+    stale = []
+    with _adomd_pool_lock:
+        idle = _adomd_idle_connections.get(key, [])
+        while idle and connection is None:
+            token, candidate = idle.pop()
+            try:
+                if token == access_token and candidate.State == 1:  # ConnectionState.Open = 1
+                    connection = candidate
+                else:
+                    stale.append(candidate)
+            except Exception:
+                stale.append(candidate)
+
+    # Close superseded or broken connections outside the lock
+    for old in stale:
+        try:
+            old.Close()
+        except Exception:
+            pass
+
+    if connection is not None:
+        return connection
+
+    workspace_name_encoded = urllib.parse.quote(workspace_name)
+    # Use URL-encoded workspace name and standard XMLA connection format
+    # The connection string format is: Data Source=powerbi://api.powerbi.com/v1.0/myorg/{workspace_name};Password={access_token};Catalog={dataset_name};
+    connection_string = f"Data Source=powerbi://api.powerbi.com/v1.0/myorg/{workspace_name_encoded};Password={access_token};Catalog={dataset_name};"
+    connection = AdomdConnection(connection_string)
+    connection.Open()
+    return connection
+
+def _checkin_adomd_connection(workspace_name: str, dataset_name: str, access_token: str, connection) -> None:
+    """Return a connection to the idle pool so later queries can reuse it."""
+    with _adomd_pool_lock:
+        _adomd_idle_connections.setdefault((workspace_name, dataset_name), []).append((access_token, connection))
+
+def _discard_adomd_connection(connection) -> None:
+    """Close a connection that failed mid-query instead of pooling it."""
+    try:
+        connection.Close()
+    except Exception as cleanup_error:
+        print(f"Warning: Error during connection cleanup: {cleanup_error}")
+
+# Mapping of SQL data types to DirectLake column data types, used when
+# generating TMSL templates. A single dict lookup replaces branching over
+# every type group for each column.
+_SQL_TO_DIRECTLAKE_TYPES = {
+    "varchar": "string", "nvarchar": "string", "char": "string",
+    "nchar": "string", "text": "string", "ntext": "string",
+    "int": "int64", "bigint": "int64", "smallint": "int64", "tinyint": "int64",
+    "decimal": "decimal", "numeric": "decimal", "float": "decimal",
+    "real": "decimal", "money": "decimal", "smallmoney": "decimal",
+    "datetime": "dateTime", "datetime2": "dateTime", "date": "dateTime",
+    "time": "dateTime", "smalldatetime": "dateTime",
+    "bit": "boolean",
+}
+
 mcp = FastMCP(
     name="Semantic Model MCP Server", 
     instructions="""
@@ -724,24 +822,16 @@ def get_azure_token_status() -> str:
     return json.dumps(status, indent=2)
 
 @mcp.tool
-def execute_dax_query(workspace_name:str, dataset_name: str, dax_query: str, dataset_id: str = None) -> list[dict]:
+def execute_dax_query(workspace_name:str, dataset_name: str, dax_query: str, dataset_id: str = None, max_rows: int = 1000) -> list[dict]:
     """Executes a DAX query against the Power BI model.
     This tool connects to the specified Power BI workspace and dataset name, executes the provided DAX query,
     Use the dataset_name to specify the model to query and NOT the dataset ID.
     The function connects to the Power BI service using an access token, executes the DAX query,
-    and returns the results.
-    """  
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    dotnet_dir = os.path.join(script_dir, "dotnet")
-    
-    print(f"Using .NET assemblies from: {dotnet_dir}")
-    
+    and returns the results. At most max_rows rows are returned (default 1000);
+    use TOPN or SELECTCOLUMNS in the query to shape larger results server-side.
+    """
     try:
-        #clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.dll"))
-        clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
-        clr.AddReference(os.path.join(dotnet_dir, "Microsoft.Identity.Client.dll"))
-        clr.AddReference(os.path.join(dotnet_dir, "Microsoft.IdentityModel.Abstractions.dll"))
-        clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.AdomdClient.dll"))
+        _ensure_dotnet_assemblies()
     except Exception as e:
         return [{"error": f"Failed to load required .NET assemblies: {str(e)}", "error_type": "assembly_load_error"}]
 
@@ -765,43 +855,50 @@ def execute_dax_query(workspace_name:str, dataset_name: str, dax_query: str, dat
     if not dax_query or not dax_query.strip():
         return [{"error": "DAX query is required and cannot be empty.", "error_type": "parameter_error"}]
 
-    workspace_name_encoded = urllib.parse.quote(workspace_name)
-    # Use URL-encoded workspace name and standard XMLA connection format
-    # The connection string format is: Data Source=powerbi://api.powerbi.com/v1.0/myorg/{workspace_name};Password={access_token};Catalog={dataset_name};
-    connection_string = f"Data Source=powerbi://api.powerbi.com/v1.0/myorg/{workspace_name_encoded};Password={access_token};Catalog={dataset_name};"
-
     connection = None
     try:
-        # Attempt to establish connection
-        connection = AdomdConnection(connection_string)
-        connection.Open()
-        
+        # Check out a pooled connection for this workspace/dataset when one is
+        # idle; connecting dominates the cost of short queries
+        connection = _checkout_adomd_connection(workspace_name, dataset_name, access_token)
+
         # Execute the DAX query
         command = connection.CreateCommand()
         command.CommandText = dax_query
         reader: AdomdDataReader = command.ExecuteReader()
-        
+
+        # Resolve column names once - reader.GetName is a .NET interop call,
+        # so invoking it per cell makes large result sets noticeably slower.
+        field_count = reader.FieldCount
+        column_names = [reader.GetName(i) for i in range(field_count)]
+
+        # Stop reading at the row cap so unbounded EVALUATE queries cannot
+        # exhaust memory, matching the local explorers' safety limit
         results = []
-        while reader.Read():
+        while reader.Read() and len(results) < max_rows:
             row = {}
-            for i in range(reader.FieldCount):
+            for i in range(field_count):
                 # Handle different data types and null values
                 value = reader.GetValue(i)
                 if value is None or str(value) == "":
-                    row[reader.GetName(i)] = None
+                    row[column_names[i]] = None
                 elif hasattr(value, 'isoformat'):  # DateTime objects
-                    row[reader.GetName(i)] = value.isoformat()
+                    row[column_names[i]] = value.isoformat()
                 else:
-                    row[reader.GetName(i)] = value
+                    row[column_names[i]] = value
             results.append(row)
-        
+
         reader.Close()
+        _checkin_adomd_connection(workspace_name, dataset_name, access_token, connection)
         return results
-        
+
     except Exception as e:
+        # Don't pool a connection that just failed - it may be broken
+        if connection is not None:
+            _discard_adomd_connection(connection)
+
         error_msg = str(e).lower()
         error_details = str(e)
-        
+
         # Categorize different types of errors and provide helpful messages
         if "authentication" in error_msg or "unauthorized" in error_msg or "login" in error_msg:
             return [{"error": f"Authentication failed: {error_details}. Please check your access token and permissions.", "error_type": "authentication_error"}]
@@ -817,15 +914,6 @@ def execute_dax_query(workspace_name:str, dataset_name: str, dax_query: str, dat
             return [{"error": f"Connection error: {error_details}. Please check your network connection and try again.", "error_type": "connection_error"}]
         else:
             return [{"error": f"Unexpected error executing DAX query: {error_details}", "error_type": "general_error", "query": dax_query}]
-    
-    finally:
-        # Ensure connection is always closed
-        try:
-            if connection is not None and hasattr(connection, 'State') and connection.State == 1:  # ConnectionState.Open = 1
-                connection.Close()
-        except Exception as cleanup_error:
-            print(f"Warning: Error during connection cleanup: {cleanup_error}")
-            # Don't return error here as it would mask the main error
 
 # Internal helper function for SQL queries (not exposed as MCP tool)
 def _internal_query_lakehouse_sql_endpoint(workspace_id: str, sql_query: str, lakehouse_id: str = None, lakehouse_name: str = None) -> str:
@@ -936,13 +1024,17 @@ def _internal_query_lakehouse_sql_endpoint(workspace_id: str, sql_query: str, la
             
             # Get column names
             columns = [column[0] for column in cursor.description]
-            
-            # Fetch results
-            rows = cursor.fetchall()
-            
+
+            # The response is capped at 100 rows, so fetch one row beyond the
+            # cap to detect truncation instead of materializing and converting
+            # the entire result set only to discard most of it.
+            max_rows = 100
+            rows = cursor.fetchmany(max_rows + 1)
+            truncated = len(rows) > max_rows
+
             # Convert to list of dictionaries
             results = []
-            for row in rows:
+            for row in rows[:max_rows]:
                 row_dict = {}
                 for i, value in enumerate(row):
                     # Handle special data types
@@ -953,15 +1045,17 @@ def _internal_query_lakehouse_sql_endpoint(workspace_id: str, sql_query: str, la
                     else:
                         row_dict[columns[i]] = value
                 results.append(row_dict)
-            
+
+            # Compact separators - result payloads can run to 100 rows and
+            # are parsed by callers, not read raw
             return json.dumps({
                 "success": True,
                 "query": sql_query,
                 "columns": columns,
                 "row_count": len(results),
-                "results": results[:100],  # Limit to first 100 rows to avoid large responses
-                "note": f"Showing first 100 rows out of {len(results)} total rows" if len(results) > 100 else None
-            }, indent=2)
+                "results": results,
+                "note": f"Showing first {max_rows} rows; remaining rows were not fetched" if truncated else None
+            }, separators=(',', ':'), default=str)
             
     except pyodbc.Error as e:
         error_details = str(e)
@@ -1079,32 +1173,29 @@ def generate_directlake_tmsl_template(workspace_id: str, lakehouse_id: str = Non
         except Exception as e:
             print(f"Warning: Could not detect schema, using default 'dbo': {e}")
         
-        # Validate table schemas
-        validated_tables = []
-        for table_name in table_names:
+        # Validate table schemas - each table needs its own INFORMATION_SCHEMA
+        # query, so fetch them concurrently. Every call opens its own SQL
+        # endpoint connection, so the workers share no state.
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fetch_table_schema(table_name):
             schema_query = f"SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_NAME = '{table_name}' ORDER BY ORDINAL_POSITION"
-            schema_result = _internal_query_lakehouse_sql_endpoint(workspace_id, schema_query, lakehouse_id, lakehouse_name)
-            
+            return _internal_query_lakehouse_sql_endpoint(workspace_id, schema_query, lakehouse_id, lakehouse_name)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(table_names), 8))) as executor:
+            schema_results = list(executor.map(fetch_table_schema, table_names))
+
+        validated_tables = []
+        for table_name, schema_result in zip(table_names, schema_results):
             try:
                 schema_data = json.loads(schema_result)
                 if schema_data.get("success"):
                     columns = []
                     for col in schema_data.get("results", []):
-                        # Map SQL types to DirectLake types
+                        # Map SQL types to DirectLake types ("string" is the fallback)
                         sql_type = col["DATA_TYPE"].lower()
-                        if sql_type in ["varchar", "nvarchar", "char", "nchar", "text", "ntext"]:
-                            dl_type = "string"
-                        elif sql_type in ["int", "bigint", "smallint", "tinyint"]:
-                            dl_type = "int64"
-                        elif sql_type in ["decimal", "numeric", "float", "real", "money", "smallmoney"]:
-                            dl_type = "decimal"
-                        elif sql_type in ["datetime", "datetime2", "date", "time", "smalldatetime"]:
-                            dl_type = "dateTime"
-                        elif sql_type in ["bit"]:
-                            dl_type = "boolean"
-                        else:
-                            dl_type = "string"  # Default fallback
-                        
+                        dl_type = _SQL_TO_DIRECTLAKE_TYPES.get(sql_type, "string")
+
                         columns.append({
                             "name": col["COLUMN_NAME"],
                             "dataType": dl_type,
@@ -1229,15 +1320,8 @@ def update_model_using_tmsl(workspace_name: str, dataset_name: str, tmsl_definit
     
     Returns:
         Success message or detailed error with suggestions for fixes
-    """   
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    dotnet_dir = os.path.join(script_dir, "dotnet")
-
-    print(f"Using .NET assemblies from: {dotnet_dir}")
-    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.dll"))
-    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
-    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.Identity.Client.dll"))
-    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.IdentityModel.Abstractions.dll"))
+    """
+    _ensure_dotnet_assemblies()
 
     from Microsoft.AnalysisServices.Tabular import Server# type: ignore
     from Microsoft.AnalysisServices import XmlaResultCollection  # type: ignore
@@ -1268,8 +1352,9 @@ def update_model_using_tmsl(workspace_name: str, dataset_name: str, tmsl_definit
         except json.JSONDecodeError as e:
             return f"Error: Invalid JSON in TMSL definition - {e}"
         
-        databaseCount = count_nodes_with_name(tmsl, "database")
-        tableCount = count_nodes_with_name(tmsl, "table")
+        nodeCounts = count_nodes_with_names(tmsl, ["database", "table"])
+        databaseCount = nodeCounts["database"]
+        tableCount = nodeCounts["table"]
         
         # Check if the tmsl_definition already has createOrReplace at the root level
         if "createOrReplace" in tmsl:
@@ -1412,16 +1497,8 @@ def get_model_definition(workspace_name:str = None, dataset_name:str=None) -> st
     and returns the result.
     Note: The workspace_name and dataset_name should be valid names in the Power BI service.
     """
-    
+    _ensure_dotnet_assemblies()
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    dotnet_dir = os.path.join(script_dir, "dotnet")
-    
-    print(f"Using .NET assemblies from: {dotnet_dir}")
-    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
-    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.Identity.Client.dll"))
-    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.IdentityModel.Abstractions.dll"))
-    
     from Microsoft.AnalysisServices.Tabular import Server,Database, JsonSerializer,SerializeOptions # type: ignore
 
     access_token = get_access_token()
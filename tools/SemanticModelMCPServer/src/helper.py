@@ -2,14 +2,22 @@
 # This file contains utility functions to assist with various tasks in the Semantic Model MCP Server.
 # It includes functions to count nodes with a specific name in a JSON-like structure.
 # This file is part of the Semantic Model MCP Server project.
-def count_nodes_with_name(data, target_name):
-    count = 0
+def count_nodes_with_names(data, target_names):
+    # Count several node names in a single walk of the structure instead of
+    # traversing the whole TMSL document once per name.
+    counts = {name: 0 for name in target_names}
+    _count_nodes(data, counts)
+    return counts
+
+def _count_nodes(data, counts):
     if isinstance(data, dict):
         for key, value in data.items():
-            if key == target_name:
-                count += 1
-            count += count_nodes_with_name(value, target_name)
+            if key in counts:
+                counts[key] += 1
+            _count_nodes(value, counts)
     elif isinstance(data, list):
         for item in data:
-            count += count_nodes_with_name(item, target_name)
-    return count
\ No newline at end of file
+            _count_nodes(item, counts)
+
+def count_nodes_with_name(data, target_name):
+    return count_nodes_with_names(data, [target_name])[target_name]
@@ -10,6 +10,45 @@ from fastmcp import FastMCP
 import json
 from core.bpa_service import BPAService
 
+# Server root (parent of the tools directory), resolved once at import time
+# instead of being recomputed inside every tool call.
+_SERVER_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Shared BPA service - constructing one parses the full bpa.json rules file,
+# so the tools reuse a single instance instead of re-loading the rules on every
+# call. Sharing also keeps violations from the last analysis available to the
+# filter tools, as their docstrings describe.
+_bpa_service = None
+
+# The Tabular Object Model assemblies only need to be registered with
+# pythonnet once per process; generate_bpa_report previously re-registered
+# them (and re-appended the server directory to sys.path) on every call.
+_tom_assemblies_loaded = False
+
+
+def _ensure_tom_assemblies() -> None:
+    """Register the Tabular Object Model assemblies with pythonnet once."""
+    global _tom_assemblies_loaded
+    if _tom_assemblies_loaded:
+        return
+
+    import clr
+
+    dotnet_dir = os.path.join(_SERVER_DIRECTORY, "dotnet")
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.Identity.Client.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.IdentityModel.Abstractions.dll"))
+
+    _tom_assemblies_loaded = True
+
+
+def _get_bpa_service() -> BPAService:
+    """Return the shared BPAService, creating it on first use."""
+    global _bpa_service
+    if _bpa_service is None:
+        _bpa_service = BPAService(_SERVER_DIRECTORY)
+    return _bpa_service
+
 def register_bpa_tools(mcp: FastMCP):
     """Register all BPA-related MCP tools"""
 
@@ -67,11 +106,11 @@ def register_bpa_tools(mcp: FastMCP):
             JSON string with BPA analysis results including violations and summary
         """
         try:
-            # Get the server directory (parent of tools directory)
-            server_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            bpa_service = BPAService(server_directory)
+            bpa_service = _get_bpa_service()
             result = bpa_service.analyze_model_from_tmsl(tmsl_definition)
-            return json.dumps(result, indent=2)
+            # Compact separators - full analysis results carry every violation
+            # and are consumed programmatically, not read raw
+            return json.dumps(result, separators=(',', ':'))
         except Exception as e:
             return json.dumps({
                 'success': False,
@@ -92,9 +131,7 @@ def register_bpa_tools(mcp: FastMCP):
             JSON string with filtered violations
         """
         try:
-            # Get the server directory (parent of tools directory)
-            server_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            bpa_service = BPAService(server_directory)
+            bpa_service = _get_bpa_service()
             violations = bpa_service.get_violations_by_severity(severity)
             
             return json.dumps({
@@ -102,7 +139,7 @@ def register_bpa_tools(mcp: FastMCP):
                 'severity_filter': severity,
                 'violation_count': len(violations),
                 'violations': violations
-            }, indent=2)
+            }, separators=(',', ':'))
             
         except Exception as e:
             return json.dumps({
@@ -124,9 +161,7 @@ def register_bpa_tools(mcp: FastMCP):
             JSON string with filtered violations
         """
         try:
-            # Get the server directory (parent of tools directory)
-            server_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            bpa_service = BPAService(server_directory)
+            bpa_service = _get_bpa_service()
             violations = bpa_service.get_violations_by_category(category)
             
             return json.dumps({
@@ -134,7 +169,7 @@ def register_bpa_tools(mcp: FastMCP):
                 'category_filter': category,
                 'violation_count': len(violations),
                 'violations': violations
-            }, indent=2)
+            }, separators=(',', ':'))
             
         except Exception as e:
             return json.dumps({
@@ -151,9 +186,7 @@ def register_bpa_tools(mcp: FastMCP):
             JSON string with rules summary including counts by category and severity
         """
         try:
-            # Get the server directory (parent of tools directory)
-            server_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            bpa_service = BPAService(server_directory)
+            bpa_service = _get_bpa_service()
             summary = bpa_service.get_rules_summary()
             
             return json.dumps({
@@ -176,9 +209,7 @@ def register_bpa_tools(mcp: FastMCP):
             JSON string with list of available categories
         """
         try:
-            # Get the server directory (parent of tools directory)
-            server_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            bpa_service = BPAService(server_directory)
+            bpa_service = _get_bpa_service()
             categories = bpa_service.get_available_categories()
             
             return json.dumps({
@@ -208,19 +239,9 @@ def register_bpa_tools(mcp: FastMCP):
         try:
             # Import required modules for PowerBI connection
             import urllib.parse
-            import sys
-            import os
-            
-            # Add .NET assemblies path
-            script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            dotnet_dir = os.path.join(script_dir, "dotnet")
-            
-            sys.path.append(script_dir)
-            import clr
-            clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
-            clr.AddReference(os.path.join(dotnet_dir, "Microsoft.Identity.Client.dll"))
-            clr.AddReference(os.path.join(dotnet_dir, "Microsoft.IdentityModel.Abstractions.dll"))
-            
+
+            _ensure_tom_assemblies()
+
             from Microsoft.AnalysisServices.Tabular import Server, Database, JsonSerializer, SerializeOptions # type: ignore
             
             # Import auth function from core
@@ -268,8 +289,7 @@ def register_bpa_tools(mcp: FastMCP):
             server.Disconnect()
             
             # Generate BPA report
-            server_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            bpa_service = BPAService(server_directory)
+            bpa_service = _get_bpa_service()
             report = bpa_service.generate_bpa_report(tmsl_definition, format_type)
             
             return json.dumps({
@@ -278,7 +298,7 @@ def register_bpa_tools(mcp: FastMCP):
                 'dataset_name': dataset_name,
                 'format_type': format_type,
                 'report': report
-            }, indent=2)
+            }, separators=(',', ':'))
             
         except Exception as e:
             return json.dumps({
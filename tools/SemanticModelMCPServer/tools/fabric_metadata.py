@@ -2,6 +2,21 @@
 import json
 from core.auth import get_access_token
 
+# Shared HTTP session - reusing one session keeps TCP/TLS connections to the
+# Power BI and Fabric APIs alive across tool calls instead of performing a new
+# handshake for every request (see MicrosoftLearnAPI for the same pattern).
+_http_session = None
+
+
+def _get_http_session():
+    """Return the shared requests.Session, creating it on first use."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        _http_session = requests.Session()
+    return _http_session
+
+
 def list_workspaces() -> str:
     """Lists available Power BI workspaces for the current user. This tool retrieves the workspaces using the Power BI REST API.
     It returns a dictionary array of workspace names and IDs.
@@ -14,7 +29,7 @@ def list_workspaces() -> str:
         return "Error: No valid access token available"
     url = "https://api.powerbi.com/v1.0/myorg/groups"
     headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code != 200:
         return f"Error: {response.status_code} - {response.text}"
     groups = response.json().get("value", [])
@@ -36,7 +51,7 @@ def list_datasets(workspace_id: str) -> str:
     
     url = f"https://api.powerbi.com/v1.0/myorg/groups/{workspace_id}/datasets"
     headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     
     if response.status_code != 200:
         return f"Error: {response.status_code} - {response.text}"
@@ -47,27 +62,43 @@ def list_datasets(workspace_id: str) -> str:
     
     return json.dumps(datasets, indent=2)
 
+# Workspace name -> ID lookups already resolved this session. Workspace IDs
+# are stable, and every uncached lookup re-fetches the caller's full
+# workspace list from the REST API.
+_workspace_id_cache = {}
+
+
 # Tool to get workspace ID by name
 def get_workspace_id(workspace_name: str) -> str:
     """Gets the workspace ID for a given workspace name.  This is useful for retrieving datasets."""
     import requests
 
+    cached_id = _workspace_id_cache.get(workspace_name)
+    if cached_id:
+        return cached_id
+
     access_token = get_access_token()
     if not access_token:
         return "Error: No valid access token available"
-    
+
     url = "https://api.powerbi.com/v1.0/myorg/groups"
     headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.get(url, headers=headers)
-    
+    response = _get_http_session().get(url, headers=headers)
+
     if response.status_code != 200:
         return f"Error: {response.status_code} - {response.text}"
-    
+
     groups = response.json().get("value", [])
+    # The response already contains every accessible workspace, so remember
+    # all of them while we have the list
     for group in groups:
-        if group.get("name") == workspace_name:
-            return group.get("id")
-    
+        if group.get("name") and group.get("id"):
+            _workspace_id_cache[group["name"]] = group["id"]
+
+    resolved_id = _workspace_id_cache.get(workspace_name)
+    if resolved_id:
+        return resolved_id
+
     return f"Workspace '{workspace_name}' not found"
 
 # Tool to list notebooks in a Power BI workspace
@@ -101,7 +132,7 @@ def list_notebooks(workspace_id: str) -> str:
         headers = {"Authorization": f"Bearer {access_token}"}
         
         # Make the API request with 30-second timeout to prevent hanging
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _get_http_session().get(url, headers=headers, timeout=30)
         
         # Handle different HTTP status codes with specific error messages
         if response.status_code == 200:
@@ -175,7 +206,7 @@ def list_delta_tables(workspace_id: str, lakehouse_id: str = None) -> str:
         if not lakehouse_id:
             # List all lakehouses in the workspace
             lakehouses_url = f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id.strip()}/lakehouses"
-            lakehouses_response = requests.get(lakehouses_url, headers=headers, timeout=30)
+            lakehouses_response = _get_http_session().get(lakehouses_url, headers=headers, timeout=30)
             
             if lakehouses_response.status_code != 200:
                 return f"Error listing lakehouses: HTTP {lakehouses_response.status_code} - {lakehouses_response.text}"
@@ -192,13 +223,10 @@ def list_delta_tables(workspace_id: str, lakehouse_id: str = None) -> str:
         # Construct API endpoint URL for listing tables in the lakehouse
         tables_url = f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id.strip()}/lakehouses/{lakehouse_id.strip()}/tables"
         
-        # Add timestamp to force fresh API call and avoid caching
-        import time
-        timestamp = str(int(time.time()))
-        print(f"DEBUG: Making API call at {timestamp} to {tables_url}")
-        
+        print(f"DEBUG: Making API call to {tables_url}")
+
         # Make the API request with 30-second timeout to prevent hanging
-        response = requests.get(tables_url, headers=headers, timeout=30)
+        response = _get_http_session().get(tables_url, headers=headers, timeout=30)
         
         # Debug information
         print(f"DEBUG: Response status code: {response.status_code}")
@@ -431,7 +459,7 @@ def list_lakehouse_files(workspace_id: str, lakehouse_id: str = None) -> str:
         if not lakehouse_id:
             # List all lakehouses in the workspace
             lakehouses_url = f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id.strip()}/lakehouses"
-            lakehouses_response = requests.get(lakehouses_url, headers=headers, timeout=30)
+            lakehouses_response = _get_http_session().get(lakehouses_url, headers=headers, timeout=30)
             
             if lakehouses_response.status_code != 200:
                 return f"Error listing lakehouses: HTTP {lakehouses_response.status_code} - {lakehouses_response.text}"
@@ -452,17 +480,24 @@ def list_lakehouse_files(workspace_id: str, lakehouse_id: str = None) -> str:
             f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id.strip()}/items"
         ]
         
-        results = {}
-        for endpoint in endpoints_to_try:
+        def probe_endpoint(endpoint):
             try:
-                response = requests.get(endpoint, headers=headers, timeout=30)
-                results[endpoint] = {
+                response = _get_http_session().get(endpoint, headers=headers, timeout=30)
+                return {
                     "status_code": response.status_code,
                     "response": response.json() if response.status_code == 200 else response.text[:200]
                 }
             except Exception as e:
-                results[endpoint] = {"error": str(e)}
-        
+                return {"error": str(e)}
+
+        # The probes are independent GET requests, so issue them concurrently
+        # rather than waiting on up to three sequential 30-second round-trips.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(endpoints_to_try)) as executor:
+            probe_results = executor.map(probe_endpoint, endpoints_to_try)
+            results = dict(zip(endpoints_to_try, probe_results))
+
         return json.dumps(results, indent=2)
             
     except Exception as e:
@@ -502,7 +537,7 @@ def get_lakehouse_sql_connection_string(workspace_id: str, lakehouse_id: str = N
         if lakehouse_name and not lakehouse_id:
             # List all lakehouses in the workspace to find the one with matching name
             lakehouses_url = f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id.strip()}/lakehouses"
-            lakehouses_response = requests.get(lakehouses_url, headers=headers, timeout=30)
+            lakehouses_response = _get_http_session().get(lakehouses_url, headers=headers, timeout=30)
             
             if lakehouses_response.status_code != 200:
                 return f"Error listing lakehouses: HTTP {lakehouses_response.status_code} - {lakehouses_response.text}"
@@ -525,7 +560,7 @@ def get_lakehouse_sql_connection_string(workspace_id: str, lakehouse_id: str = N
         
         # Get specific lakehouse details to extract SQL endpoint information
         lakehouse_url = f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id.strip()}/lakehouses/{lakehouse_id.strip()}"
-        response = requests.get(lakehouse_url, headers=headers, timeout=30)
+        response = _get_http_session().get(lakehouse_url, headers=headers, timeout=30)
         
         # Handle different HTTP status codes
         if response.status_code == 200:
@@ -612,7 +647,7 @@ def list_lakehouses(workspace_id: str) -> str:
         headers = {"Authorization": f"Bearer {access_token}"}
         
         # Make the API request with 30-second timeout to prevent hanging
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _get_http_session().get(url, headers=headers, timeout=30)
         
         # Handle different HTTP status codes with specific error messages
         if response.status_code == 200:
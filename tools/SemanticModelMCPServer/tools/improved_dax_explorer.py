@@ -10,10 +10,33 @@ References:
 
 import json
 import logging
+import os
 from typing import List, Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# The Analysis Services assemblies only need to be registered with pythonnet
+# once per process; repeating clr.AddReference on every query is redundant
+# per-call work.
+_assemblies_loaded = False
+
+def _ensure_assemblies_loaded() -> None:
+    """Register the bundled Analysis Services assemblies once per process."""
+    global _assemblies_loaded
+    if _assemblies_loaded:
+        return
+
+    import clr
+
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    dotnet_dir = os.path.join(os.path.dirname(current_dir), "dotnet")
+
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
+    clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.AdomdClient.dll"))
+
+    _assemblies_loaded = True
+
 class ImprovedDAXExplorer:
     """
     Enhanced DAX explorer with better error handling and table reference support.
@@ -33,16 +56,9 @@ class ImprovedDAXExplorer:
             Dictionary with execution results or error information
         """
         try:
-            import clr
-            import os
-            
-            # Add references to Analysis Services libraries
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            dotnet_dir = os.path.join(os.path.dirname(current_dir), "dotnet")
-            
-            clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.AdomdClient.dll"))
+            _ensure_assemblies_loaded()
             from Microsoft.AnalysisServices.AdomdClient import AdomdConnection
-            
+
             # Connect to local Power BI Desktop
             conn = AdomdConnection(self.connection_string)
             conn.Open()
@@ -54,24 +70,27 @@ class ImprovedDAXExplorer:
                 
                 reader = cmd.ExecuteReader()
                 
-                # Get column information
+                # Get column information once; the metadata calls cross the
+                # .NET interop boundary, so they should not repeat per row.
+                field_count = reader.FieldCount
                 columns = []
-                for i in range(reader.FieldCount):
+                for i in range(field_count):
                     columns.append({
                         'name': reader.GetName(i),
                         'index': i,
                         'type': str(reader.GetFieldType(i)) if reader.GetFieldType(i) else 'Unknown'
                     })
-                
+                column_names = [column['name'] for column in columns]
+
                 # Read data rows with improved error handling
                 rows = []
                 row_count = 0
                 max_rows = 1000  # Safety limit to prevent memory issues
-                
+
                 while reader.Read() and row_count < max_rows:
                     row = {}
-                    for i in range(reader.FieldCount):
-                        column_name = reader.GetName(i)
+                    for i in range(field_count):
+                        column_name = column_names[i]
                         try:
                             value = reader[i]
                             if value is None:
@@ -295,6 +314,21 @@ TOPN({max_rows}, {table_ref})
             }
 
 
+# Explorers keyed by connection string - the module functions are called once
+# per MCP tool invocation, so reusing explorers avoids rebuilding one for every
+# query against the same local instance.
+_explorer_cache: Dict[str, ImprovedDAXExplorer] = {}
+
+
+def _get_explorer(connection_string: str) -> ImprovedDAXExplorer:
+    """Return a cached ImprovedDAXExplorer for the given connection string."""
+    explorer = _explorer_cache.get(connection_string)
+    if explorer is None:
+        explorer = ImprovedDAXExplorer(connection_string)
+        _explorer_cache[connection_string] = explorer
+    return explorer
+
+
 def execute_improved_dax_query(connection_string: str, dax_query: str) -> str:
     """
     Execute a DAX query using the improved explorer.
@@ -307,7 +341,7 @@ def execute_improved_dax_query(connection_string: str, dax_query: str) -> str:
         JSON string with query results
     """
     try:
-        explorer = ImprovedDAXExplorer(connection_string)
+        explorer = _get_explorer(connection_string)
         result = explorer._safe_execute_dax(dax_query)
         return json.dumps(result, indent=2)
         
@@ -335,7 +369,7 @@ def query_table_safely(connection_string: str, table_name: str, max_rows: int =
         JSON string with query results
     """
     try:
-        explorer = ImprovedDAXExplorer(connection_string)
+        explorer = _get_explorer(connection_string)
         result = explorer.execute_table_query(table_name, max_rows)
         return json.dumps(result, indent=2)
         
@@ -361,8 +395,8 @@ def explore_model_structure(connection_string: str) -> str:
         JSON string with model structure information
     """
     try:
-        explorer = ImprovedDAXExplorer(connection_string)
-        
+        explorer = _get_explorer(connection_string)
+
         # Get tables
         tables_result = explorer.get_available_tables()
         
@@ -407,17 +441,9 @@ def get_local_tmsl_definition(connection_string: str) -> str:
         - Connection details and metadata
     """
     try:
-        import clr
-        import os
-        
-        # Add references to Analysis Services libraries
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        dotnet_dir = os.path.join(os.path.dirname(current_dir), "dotnet")
-        
-        # Load required assemblies for TMSL operations
-        clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
+        _ensure_assemblies_loaded()
         from Microsoft.AnalysisServices.Tabular import Server, Database, JsonSerializer, SerializeOptions
-        
+
         # Connect to local Power BI Desktop
         server = Server()
         server.Connect(connection_string)
@@ -525,21 +551,9 @@ def update_local_model_using_tmsl(connection_string: str, tmsl_definition: str,
     Returns:
         JSON string with success message or detailed error with suggestions for fixes
     """
-    import json
-    import logging
-    import os
-    import clr
-    
-    logger = logging.getLogger(__name__)
-    
     try:
-        # Load and import the necessary .NET assemblies
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        dotnet_dir = os.path.join(script_dir, "dotnet")
-        
-        clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.dll"))
-        clr.AddReference(os.path.join(dotnet_dir, "Microsoft.AnalysisServices.Tabular.dll"))
-        
+        _ensure_assemblies_loaded()
+
         from Microsoft.AnalysisServices.Tabular import Server  # type: ignore
         from Microsoft.AnalysisServices import XmlaResultCollection  # type: ignore
         import System  # type: ignore
@@ -249,13 +249,14 @@ class LocalPowerBIModelExplorer:
             logger.error(f"Error connecting to local Power BI Desktop: {str(e)}")
             raise e
     
-    def execute_dax_query(self, dax_query: str) -> Dict[str, Any]:
+    def execute_dax_query(self, dax_query: str, max_rows: int = 1000) -> Dict[str, Any]:
         """
         Execute a DAX query against the local Power BI Desktop model.
-        
+
         Args:
             dax_query: DAX query to execute
-            
+            max_rows: Safety limit on the number of rows read from the result
+
         Returns:
             Dictionary containing query results
         """
@@ -281,31 +282,43 @@ class LocalPowerBIModelExplorer:
                 
                 reader = cmd.ExecuteReader()
                 
-                # Get column information
+                # Get column information once up front; FieldCount and the
+                # metadata getters are .NET interop calls, so keep them out of
+                # the per-row loop.
+                field_count = reader.FieldCount
+                field_range = range(field_count)
                 columns = []
-                for i in range(reader.FieldCount):
+                for i in field_range:
                     columns.append({
                         'name': reader.GetName(i),
                         'type': str(reader.GetFieldType(i))
                     })
-                
-                # Get data rows
+
+                # Get data rows, stopping at the safety limit so unbounded
+                # EVALUATE queries cannot exhaust memory. Reading one row past
+                # the cap tells us whether anything was actually dropped, so a
+                # result of exactly max_rows rows is not reported as truncated.
                 rows = []
+                truncated = False
                 while reader.Read():
+                    if len(rows) >= max_rows:
+                        truncated = True
+                        break
                     row = []
-                    for i in range(reader.FieldCount):
+                    for i in field_range:
                         value = reader.GetValue(i)
                         row.append(str(value) if value is not None else None)
                     rows.append(row)
-                
+
                 reader.Close()
                 conn.Close()
-                
+
                 return {
                     'success': True,
                     'columns': columns,
                     'rows': rows,
                     'row_count': len(rows),
+                    'truncated': truncated,
                     'query': dax_query
                 }
                 
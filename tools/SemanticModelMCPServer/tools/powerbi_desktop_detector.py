@@ -6,14 +6,59 @@ and their Analysis Services port numbers for local development and testing.
 """
 
 import json
-import subprocess
 import re
 import logging
-import psutil
 from typing import List, Dict, Optional, Tuple
 
+# psutil is imported lazily inside the scanning methods so that importing this
+# module (which happens at server startup) does not pay the process-scanning
+# library's import cost when the detection tools are never invoked.
+
 logger = logging.getLogger(__name__)
 
+# Static comparison of Analysis Services connection types. Built once at import
+# time; compare_connection_types previously rebuilt this dictionary per call.
+_CONNECTION_TYPE_COMPARISON = {
+    'power_bi_desktop': {
+        'connection_string': 'Data Source=localhost:{port}',
+        'authentication': 'None required (local process)',
+        'use_case': 'Development, testing, debugging',
+        'advantages': ['No authentication needed', 'Direct model access', 'Fast connection', 'Local data'],
+        'requirements': ['Power BI Desktop running', 'Model file open']
+    },
+    'power_bi_service': {
+        'connection_string': 'Data Source=powerbi://api.powerbi.com/v1.0/myorg/{workspace};Initial Catalog={dataset}',
+        'authentication': 'Access token or user credentials required',
+        'use_case': 'Production, published models, collaboration',
+        'advantages': ['Shared access', 'Premium features', 'Scheduled refresh', 'Cloud scalability'],
+        'requirements': ['Published model', 'Valid authentication', 'Network access']
+    },
+    'analysis_services': {
+        'connection_string': 'Data Source={server};Initial Catalog={database}',
+        'authentication': 'Windows authentication or username/password',
+        'use_case': 'Enterprise tabular models, on-premises',
+        'advantages': ['Full control', 'Custom configuration', 'Enterprise security'],
+        'requirements': ['Analysis Services server', 'Network access', 'Proper permissions']
+    }
+}
+
+# Port patterns compiled once at import time; _extract_port_from_cmdline runs
+# them against every msmdsrv command line it sees.
+_PORT_PATTERNS = [
+    re.compile(r'-s\s+localhost:(\d+)', re.IGNORECASE),  # -s localhost:port
+    re.compile(r'--port[=\s](\d+)', re.IGNORECASE),      # --port=port or --port port
+    re.compile(r'Port=(\d+)', re.IGNORECASE),            # Port=port
+    re.compile(r':(\d+)', re.IGNORECASE),                # :port
+]
+
+# Static usage guidance included with every detection payload, built once at
+# import time instead of per call.
+_DETECTION_INSTRUCTIONS = {
+    'connection_usage': 'Use the connection_string to connect to local Power BI Desktop models',
+    'port_info': 'Power BI Desktop typically uses dynamic ports above 50000',
+    'testing': 'Use test_powerbi_desktop_connection(port) to verify connectivity'
+}
+
 class PowerBIDesktopDetector:
     """
     Utility class for detecting running Power BI Desktop instances
@@ -27,25 +72,35 @@ class PowerBIDesktopDetector:
             "Microsoft.Mashup.Container.exe"  # Power Query process
         ]
     
-    def find_powerbi_desktop_instances(self) -> List[Dict[str, any]]:
+    def _scan_processes(self) -> Tuple[List[Dict[str, any]], List[Dict[str, any]]]:
         """
-        Find all running Power BI Desktop instances with their process information.
-        
+        Scan the process table once, collecting both Power BI Desktop and
+        Analysis Services instances.
+
+        A single psutil pass replaces the two full process scans the finder
+        methods previously performed back to back.
+
         Returns:
-            List of dictionaries containing Power BI Desktop instance information
+            Tuple of (Power BI Desktop instances, Analysis Services instances)
         """
-        instances = []
-        
+        import psutil
+
+        pbi_instances = []
+        as_instances = []
+        # Built on first use; one system-wide socket scan replaces a
+        # per-process connections() call for every msmdsrv instance.
+        listening_ports_by_pid = None
+
         try:
             for process in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time']):
                 try:
                     process_info = process.info
                     process_name = process_info['name']
-                    
-                    if process_name in ['PBIDesktop.exe']:
+
+                    if process_name == 'PBIDesktop.exe':
                         # Found Power BI Desktop process
                         cmdline = process_info.get('cmdline', [])
-                        
+
                         instance = {
                             'process_name': process_name,
                             'pid': process_info['pid'],
@@ -55,82 +110,83 @@ class PowerBIDesktopDetector:
                             'workspace_id': None,
                             'file_path': None
                         }
-                        
+
                         # Try to extract file path from command line
                         if cmdline:
                             for arg in cmdline:
                                 if arg.endswith('.pbix'):
                                     instance['file_path'] = arg
                                     break
-                        
-                        instances.append(instance)
-                        
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error finding Power BI Desktop instances: {str(e)}")
-            
-        return instances
-    
-    def find_analysis_services_ports(self) -> List[Dict[str, any]]:
-        """
-        Find Analysis Services (msmdsrv.exe) processes and their port numbers.
-        
-        Returns:
-            List of dictionaries containing Analysis Services instance information
-        """
-        as_instances = []
-        
-        try:
-            for process in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    process_info = process.info
-                    
-                    if process_info['name'] == 'msmdsrv.exe':
+
+                        pbi_instances.append(instance)
+
+                    elif process_name == 'msmdsrv.exe':
                         # Found Analysis Services process
                         pid = process_info['pid']
                         cmdline = process_info.get('cmdline', [])
-                        
+
                         # Try to get port from command line arguments
                         port = self._extract_port_from_cmdline(cmdline)
-                        
+
                         # If not found in cmdline, check network connections
                         if not port:
-                            port = self._extract_port_from_connections(process)
-                        
+                            if listening_ports_by_pid is None:
+                                listening_ports_by_pid = self._get_listening_ports_by_pid()
+                            port = self._select_listening_port(listening_ports_by_pid.get(pid, []))
+
                         # Try to determine if this is a Power BI Desktop instance
                         is_pbi_desktop = self._is_powerbi_desktop_as_instance(cmdline)
-                        
-                        instance = {
+
+                        as_instances.append({
                             'process_name': 'msmdsrv.exe',
                             'pid': pid,
                             'port': port,
                             'cmdline': ' '.join(cmdline) if cmdline else '',
                             'is_powerbi_desktop': is_pbi_desktop,
                             'connection_string': f"Data Source=localhost:{port}" if port else None
-                        }
-                        
-                        as_instances.append(instance)
-                        
+                        })
+
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, AttributeError):
                     continue
-                    
+
         except Exception as e:
-            logger.error(f"Error finding Analysis Services instances: {str(e)}")
-            
+            logger.error(f"Error scanning for Power BI Desktop processes: {str(e)}")
+
+        return pbi_instances, as_instances
+
+    def find_powerbi_desktop_instances(self) -> List[Dict[str, any]]:
+        """
+        Find all running Power BI Desktop instances with their process information.
+
+        Returns:
+            List of dictionaries containing Power BI Desktop instance information
+        """
+        pbi_instances, _ = self._scan_processes()
+        return pbi_instances
+
+    def find_analysis_services_ports(self) -> List[Dict[str, any]]:
+        """
+        Find Analysis Services (msmdsrv.exe) processes and their port numbers.
+
+        Returns:
+            List of dictionaries containing Analysis Services instance information
+        """
+        _, as_instances = self._scan_processes()
         return as_instances
-    
+
     def get_powerbi_desktop_connections(self) -> List[Dict[str, any]]:
         """
         Get complete connection information for Power BI Desktop instances.
-        
+
         Returns:
             List of dictionaries with combined Power BI Desktop and Analysis Services info
         """
-        pbi_instances = self.find_powerbi_desktop_instances()
-        as_instances = self.find_analysis_services_ports()
-        
+        pbi_instances, as_instances = self._scan_processes()
+        return self._combine_connections(pbi_instances, as_instances)
+
+    def _combine_connections(self, pbi_instances: List[Dict[str, any]],
+                             as_instances: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        """Combine already-scanned Power BI Desktop and Analysis Services instances."""
         # Filter to only Power BI Desktop related Analysis Services instances
         pbi_as_instances = [as_inst for as_inst in as_instances if as_inst['is_powerbi_desktop']]
         
@@ -189,17 +245,10 @@ class PowerBIDesktopDetector:
             return None
             
         cmdline_str = ' '.join(cmdline)
-        
+
         # Look for port patterns in command line
-        port_patterns = [
-            r'-s\s+localhost:(\d+)',  # -s localhost:port
-            r'--port[=\s](\d+)',      # --port=port or --port port
-            r'Port=(\d+)',            # Port=port
-            r':(\d+)',                # :port
-        ]
-        
-        for pattern in port_patterns:
-            match = re.search(pattern, cmdline_str, re.IGNORECASE)
+        for pattern in _PORT_PATTERNS:
+            match = pattern.search(cmdline_str)
             if match:
                 try:
                     return int(match.group(1))
@@ -208,29 +257,30 @@ class PowerBIDesktopDetector:
         
         return None
     
-    def _extract_port_from_connections(self, process) -> Optional[int]:
-        """Extract port number from process network connections."""
+    def _get_listening_ports_by_pid(self) -> Dict[int, List[int]]:
+        """Map process ids to their listening localhost ports with one scan."""
+        import psutil
+
+        ports_by_pid = {}
+
         try:
-            # Check if the process has the connections method
-            if not hasattr(process, 'connections'):
-                return None
-                
-            connections = process.connections()
-            
-            for conn in connections:
-                if (conn.status == psutil.CONN_LISTEN and 
-                    conn.laddr.ip in ['127.0.0.1', '0.0.0.0', '::']):
-                    # Found a listening connection on localhost
-                    port = conn.laddr.port
-                    
-                    # Analysis Services typically uses ports in certain ranges
-                    # Power BI Desktop usually uses dynamic ports > 50000
-                    if port > 1024:  # Skip system ports
-                        return port
-                        
-        except (psutil.AccessDenied, psutil.NoSuchProcess, AttributeError):
+            for conn in psutil.net_connections(kind='tcp'):
+                if (conn.status == psutil.CONN_LISTEN and conn.pid and
+                        conn.laddr and conn.laddr.ip in ['127.0.0.1', '0.0.0.0', '::']):
+                    ports_by_pid.setdefault(conn.pid, []).append(conn.laddr.port)
+        except (psutil.AccessDenied, psutil.Error):
             pass
-            
+
+        return ports_by_pid
+
+    def _select_listening_port(self, ports: List[int]) -> Optional[int]:
+        """Pick the first plausible Analysis Services port from a process's listeners."""
+        for port in ports:
+            # Analysis Services typically uses ports in certain ranges
+            # Power BI Desktop usually uses dynamic ports > 50000
+            if port > 1024:  # Skip system ports
+                return port
+
         return None
     
     def _is_powerbi_desktop_as_instance(self, cmdline: List[str]) -> bool:
@@ -276,33 +326,11 @@ class PowerBIDesktopDetector:
     def compare_connection_types(self) -> Dict[str, str]:
         """
         Compare different Analysis Services connection types.
-        
+
         Returns:
             Dictionary with connection type comparisons and explanations
         """
-        return {
-            'power_bi_desktop': {
-                'connection_string': 'Data Source=localhost:{port}',
-                'authentication': 'None required (local process)',
-                'use_case': 'Development, testing, debugging',
-                'advantages': ['No authentication needed', 'Direct model access', 'Fast connection', 'Local data'],
-                'requirements': ['Power BI Desktop running', 'Model file open']
-            },
-            'power_bi_service': {
-                'connection_string': 'Data Source=powerbi://api.powerbi.com/v1.0/myorg/{workspace};Initial Catalog={dataset}',
-                'authentication': 'Access token or user credentials required',
-                'use_case': 'Production, published models, collaboration',
-                'advantages': ['Shared access', 'Premium features', 'Scheduled refresh', 'Cloud scalability'],
-                'requirements': ['Published model', 'Valid authentication', 'Network access']
-            },
-            'analysis_services': {
-                'connection_string': 'Data Source={server};Initial Catalog={database}',
-                'authentication': 'Windows authentication or username/password',
-                'use_case': 'Enterprise tabular models, on-premises',
-                'advantages': ['Full control', 'Custom configuration', 'Enterprise security'],
-                'requirements': ['Analysis Services server', 'Network access', 'Proper permissions']
-            }
-        }
+        return _CONNECTION_TYPE_COMPARISON
     
     def test_connection(self, port: int) -> Dict[str, any]:
         """
@@ -403,37 +431,40 @@ class PowerBIDesktopDetector:
                 'message': 'Connection failed'
             }
 
+# Shared detector instance - the detector is stateless apart from its static
+# process-name list, so the module-level functions reuse one object instead of
+# constructing a new detector on every call.
+_detector = PowerBIDesktopDetector()
+
 def detect_powerbi_desktop_instances() -> str:
     """
     Detect running Power BI Desktop instances and return connection information.
-    
+
     Returns:
         JSON string with detected instances and connection details
     """
-    detector = PowerBIDesktopDetector()
-    
+    detector = _detector
+
     try:
-        # Get all Power BI Desktop related instances
-        instances = detector.get_powerbi_desktop_connections()
-        
-        # Get Analysis Services specific information
-        as_instances = detector.find_analysis_services_ports()
-        
+        # Scan the process table once and reuse the results for both the
+        # combined instance list and the Analysis Services breakdown.
+        pbi_instances, as_instances = detector._scan_processes()
+        instances = detector._combine_connections(pbi_instances, as_instances)
+
+
         result = {
             'success': True,
             'powerbi_desktop_instances': instances,
             'analysis_services_instances': as_instances,
             'total_instances': len(instances),
             'total_as_instances': len(as_instances),
-            'instructions': {
-                'connection_usage': 'Use the connection_string to connect to local Power BI Desktop models',
-                'port_info': 'Power BI Desktop typically uses dynamic ports above 50000',
-                'testing': 'Use test_powerbi_desktop_connection(port) to verify connectivity'
-            }
+            'instructions': _DETECTION_INSTRUCTIONS
         }
         
-        return json.dumps(result, indent=2, default=str)
-        
+        # Compact separators - the instance payload includes full command lines
+        # and can get large, and it is consumed programmatically, not read raw.
+        return json.dumps(result, separators=(',', ':'), default=str)
+
     except Exception as e:
         logger.error(f"Error detecting Power BI Desktop instances: {str(e)}")
         return json.dumps({
@@ -454,6 +485,5 @@ def test_powerbi_desktop_connection(port: int) -> str:
     Returns:
         JSON string with connection test results
     """
-    detector = PowerBIDesktopDetector()
-    result = detector.test_connection(port)
+    result = _detector.test_connection(port)
     return json.dumps(result, indent=2, default=str)
@@ -13,6 +13,73 @@ from tools.ultra_fast_powerbi_detector import detect_powerbi_desktop_instances_u
 from tools.improved_dax_explorer import get_local_tmsl_definition, update_local_model_using_tmsl
 from tools.simple_dax_explorer import explore_local_powerbi_simple, execute_local_dax_query
 
+# Static connection-type comparison payload, serialized once at import time.
+# The compare tool previously rebuilt and re-serialized this dictionary on
+# every call even though nothing in it varies.
+_CONNECTION_COMPARISON_JSON = json.dumps({
+    'success': True,
+    'connection_types': {
+        'power_bi_desktop': {
+            'complexity': 'Very Simple',
+            'authentication': 'None',
+            'example': 'Data Source=localhost:51542',
+            'best_for': 'Development and testing',
+            'description': 'Direct connection to local Analysis Services instance'
+        },
+        'power_bi_service': {
+            'complexity': 'Complex',
+            'authentication': 'Access Token Required',
+            'example': 'Data Source=powerbi://api.powerbi.com/v1.0/myorg/workspace;Initial Catalog=dataset;User ID=app:id@tenant;Password=token',
+            'best_for': 'Production and collaboration',
+            'description': 'Cloud-based connection requiring Azure AD authentication'
+        },
+        'analysis_services': {
+            'complexity': 'Moderate',
+            'authentication': 'Windows/SQL Authentication',
+            'example': 'Data Source=server;Initial Catalog=database;Integrated Security=SSPI',
+            'best_for': 'Enterprise and on-premises',
+            'description': 'Traditional Analysis Services connection'
+        }
+    },
+    'key_differences': {
+        'authentication_complexity': {
+            'power_bi_desktop': 'No authentication needed - runs under user context',
+            'power_bi_service': 'Requires Azure AD token with Power BI permissions',
+            'analysis_services': 'Requires Windows or SQL Server authentication'
+        },
+        'network_requirements': {
+            'power_bi_desktop': 'Localhost only - no network connectivity required',
+            'power_bi_service': 'Internet connection required for API access',
+            'analysis_services': 'Network access to server required'
+        },
+        'use_case_scenarios': {
+            'power_bi_desktop': 'Local development, debugging, testing before publish',
+            'power_bi_service': 'Published models, shared datasets, production environments',
+            'analysis_services': 'Enterprise tabular models, on-premises or Azure AS'
+        }
+    },
+    'implementation_tips': {
+        'power_bi_desktop': [
+            'Use automatic detection to find running instances',
+            'No credential management needed',
+            'Perfect for iterative development',
+            'Test frequently during model development'
+        ],
+        'power_bi_service': [
+            'Implement token refresh mechanisms',
+            'Handle authentication errors gracefully',
+            'Cache connections when possible',
+            'Monitor token expiration'
+        ],
+        'analysis_services': [
+            'Use connection pooling for performance',
+            'Implement proper error handling',
+            'Monitor connection health',
+            'Use Windows Authentication when possible'
+        ]
+    }
+}, indent=2)
+
 def register_powerbi_desktop_tools(mcp: FastMCP):
     """Register all Power BI Desktop related MCP tools"""
 
@@ -294,79 +361,7 @@ def register_powerbi_desktop_tools(mcp: FastMCP):
             JSON string with comprehensive comparison of connection types,
             authentication requirements, use cases, and implementation examples
         """
-        try:
-            result = {
-                'success': True,
-                'connection_types': {
-                    'power_bi_desktop': {
-                        'complexity': 'Very Simple',
-                        'authentication': 'None',
-                        'example': 'Data Source=localhost:51542',
-                        'best_for': 'Development and testing',
-                        'description': 'Direct connection to local Analysis Services instance'
-                    },
-                    'power_bi_service': {
-                        'complexity': 'Complex',
-                        'authentication': 'Access Token Required',
-                        'example': 'Data Source=powerbi://api.powerbi.com/v1.0/myorg/workspace;Initial Catalog=dataset;User ID=app:id@tenant;Password=token',
-                        'best_for': 'Production and collaboration',
-                        'description': 'Cloud-based connection requiring Azure AD authentication'
-                    },
-                    'analysis_services': {
-                        'complexity': 'Moderate',
-                        'authentication': 'Windows/SQL Authentication',
-                        'example': 'Data Source=server;Initial Catalog=database;Integrated Security=SSPI',
-                        'best_for': 'Enterprise and on-premises',
-                        'description': 'Traditional Analysis Services connection'
-                    }
-                },
-                'key_differences': {
-                    'authentication_complexity': {
-                        'power_bi_desktop': 'No authentication needed - runs under user context',
-                        'power_bi_service': 'Requires Azure AD token with Power BI permissions',
-                        'analysis_services': 'Requires Windows or SQL Server authentication'
-                    },
-                    'network_requirements': {
-                        'power_bi_desktop': 'Localhost only - no network connectivity required',
-                        'power_bi_service': 'Internet connection required for API access',
-                        'analysis_services': 'Network access to server required'
-                    },
-                    'use_case_scenarios': {
-                        'power_bi_desktop': 'Local development, debugging, testing before publish',
-                        'power_bi_service': 'Published models, shared datasets, production environments',
-                        'analysis_services': 'Enterprise tabular models, on-premises or Azure AS'
-                    }
-                },
-                'implementation_tips': {
-                    'power_bi_desktop': [
-                        'Use automatic detection to find running instances',
-                        'No credential management needed',
-                        'Perfect for iterative development',
-                        'Test frequently during model development'
-                    ],
-                    'power_bi_service': [
-                        'Implement token refresh mechanisms',
-                        'Handle authentication errors gracefully',
-                        'Cache connections when possible',
-                        'Monitor token expiration'
-                    ],
-                    'analysis_services': [
-                        'Use connection pooling for performance',
-                        'Implement proper error handling',
-                        'Monitor connection health',
-                        'Use Windows Authentication when possible'
-                    ]
-                }
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            return json.dumps({
-                'success': False,
-                'error': f'Error comparing connection types: {str(e)}',
-                'error_type': 'connection_comparison_error'
-            })
+        return _CONNECTION_COMPARISON_JSON
 
     @mcp.tool
     def compare_powerbi_detection_methods() -> str:
@@ -277,20 +277,23 @@ def execute_local_dax_query(connection_string: str, dax_query: str) -> str:
             
             reader = cmd.ExecuteReader()
             
-            # Get column information
+            # Get column information once; FieldCount and GetName are .NET
+            # interop calls, so they stay out of the per-row loop
+            field_count = reader.FieldCount
             columns = []
-            for i in range(reader.FieldCount):
+            for i in range(field_count):
                 columns.append({
                     'name': reader.GetName(i),
                     'index': i
                 })
-            
+            column_names = [column['name'] for column in columns]
+
             # Read data rows
             rows = []
             while reader.Read():
                 row = {}
-                for i in range(reader.FieldCount):
-                    column_name = reader.GetName(i)
+                for i in range(field_count):
+                    column_name = column_names[i]
                     try:
                         value = reader[i]
                         # Convert to string for JSON serialization
@@ -7,15 +7,19 @@ using the most efficient system commands and minimal process scanning.
 
 import json
 import subprocess
-import re
 import logging
-import psutil
 from typing import List, Dict, Optional, Tuple
-import os
-import sys
 
 logger = logging.getLogger(__name__)
 
+# Static usage guidance included with every detection result. Built once at
+# import time; only the per-run performance line is added per call.
+_DETECTION_INSTRUCTIONS = {
+    'connection_usage': 'Use the connection_string to connect to local Power BI Desktop models',
+    'port_info': 'Power BI Desktop typically uses dynamic ports above 50000',
+    'testing': 'Use test_powerbi_desktop_connection(port) to verify connectivity'
+}
+
 class UltraFastPowerBIDesktopDetector:
     """
     Ultra-optimized utility class for lightning-fast detection of running Power BI Desktop instances.
@@ -81,12 +85,10 @@ class UltraFastPowerBIDesktopDetector:
                     'as_processes_found': len(as_processes),
                     'pbi_processes_found': len(pbi_processes)
                 },
-                'instructions': {
-                    'connection_usage': 'Use the connection_string to connect to local Power BI Desktop models',
-                    'port_info': 'Power BI Desktop typically uses dynamic ports above 50000',
-                    'performance': f'Ultra-fast detection completed in {detection_time:.1f}ms',
-                    'testing': 'Use test_powerbi_desktop_connection(port) to verify connectivity'
-                }
+                'instructions': dict(
+                    _DETECTION_INSTRUCTIONS,
+                    performance=f'Ultra-fast detection completed in {detection_time:.1f}ms'
+                )
             })
             
             # Cache the result
@@ -109,9 +111,13 @@ class UltraFastPowerBIDesktopDetector:
         """
         Single-pass process detection - get only what we need, when we need it.
         """
+        # Imported here rather than at module load so server startup does not
+        # pay for psutil when ultra-fast detection is never used.
+        import psutil
+
         pbi_processes = []
         as_processes = []
-        
+
         try:
             # Single pass through processes - only get name and pid first
             for proc in psutil.process_iter(['pid', 'name']):
@@ -200,8 +206,11 @@ class UltraFastPowerBIDesktopDetector:
                         if len(parts) >= 5:
                             try:
                                 local_addr = parts[1]
-                                if ':' in local_addr:
-                                    port = int(local_addr.split(':')[-1])
+                                # rpartition avoids building a list of every
+                                # address segment just to take the last one
+                                _, sep, port_str = local_addr.rpartition(':')
+                                if sep:
+                                    port = int(port_str)
                                     pid = int(parts[4])
                                     
                                     # Only interested in ports > 50000 (Power BI Desktop range)
@@ -278,14 +287,17 @@ class UltraFastPowerBIDesktopDetector:
         self._cache_time = 0
 
 
+# Shared detector instance - reusing one detector keeps its 5-second result
+# cache effective across calls; a fresh detector per call would always rescan.
+_detector = UltraFastPowerBIDesktopDetector()
+
 # Ultra-fast detection function for MCP tools
 def detect_powerbi_desktop_instances_ultra_fast() -> Dict:
     """
     Ultra-fast detection of Power BI Desktop instances using optimized methods.
-    
+
     Returns:
         Dictionary with detected instances and performance metrics
     """
-    detector = UltraFastPowerBIDesktopDetector()
-    result = detector.detect_ultra_fast()
+    result = _detector.detect_ultra_fast()
     return result